@@ -94,4 +94,18 @@ def test_binary_classification_metrics_003(tc):
     assert(cm.precision, 0.5, "computed precision for this model should be equal to 0.5")
 
     confusion_matrix = cm.confusion_matrix.values.tolist()
-    assert(confusion_matrix, [[1, 0], [1, 2]], "computed confusion_matrix for this models should be equal to [[1, 0], [1, 2]]")
\ No newline at end of file
+    assert(confusion_matrix, [[1, 0], [1, 2]], "computed confusion_matrix for this models should be equal to [[1, 0], [1, 2]]")
+
+
+# Tests that a negative beta is rejected before reaching the engine
+def test_binary_classification_metrics_negative_beta(tc):
+    rows = [[0, 0],[1, 1]]
+    schema = [('labels', int),('predictions', int)]
+    frame = tc.frame.create(rows, schema)
+
+    try:
+        frame.binary_classification_metrics('labels', 'predictions', 1, -1)
+    except ValueError as e:
+        assert("beta" in str(e))
+    else:
+        raise RuntimeError("Expected ValueError for negative beta")
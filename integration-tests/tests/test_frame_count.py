@@ -0,0 +1,48 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from setup import tc, rm, get_sandbox_path
+
+def test_count_after_python_filter(tc):
+    """
+    Checks that the cached row count is refreshed after filter and drop_rows on a python frame
+    """
+    frame = tc.frame.create([[i] for i in xrange(0, 10)], [("number", int)])
+    assert(frame._is_python)
+    assert(frame.count() == 10)
+    frame.filter(lambda row: row.number < 6)
+    assert(frame._is_python)
+    assert(frame.count() == 6)
+    assert(frame.count() == 6)
+    frame.drop_rows(lambda row: row.number < 2)
+    assert(frame._is_python)
+    assert(frame.count() == 4)
+
+def test_count_after_scala_append(tc):
+    """
+    Checks that the cached row count is refreshed after append and drop_duplicates on a scala frame
+    """
+    frame = tc.frame.create([[i] for i in xrange(0, 10)], [("number", int)])
+    frame.append(tc.frame.create([[i] for i in xrange(0, 5)], [("number", int)]))
+    assert(frame._is_scala)
+    assert(frame.count() == 15)
+    frame.append(tc.frame.create([[i] for i in xrange(10, 15)], [("number", int)]))
+    assert(frame._is_scala)
+    assert(frame.count() == 20)
+    assert(frame.count() == 20)
+    frame.drop_duplicates()
+    assert(frame._is_scala)
+    assert(frame.count() == 15)
@@ -98,6 +98,36 @@ def test_create_frame_with_schema(tc):
     assert(frame.count() == 3)
     assert(frame.schema == [("col_a", int), ("col_b", str), ("col_c", float)])
 
+def test_create_frame_from_numpy_array(tc):
+    """
+    Tests creating a frame from a 2-dimensional numpy array.  Data types should come from the array's dtype when it
+    has a direct equivalent, and otherwise be inferred from the values.
+    """
+    import numpy as np
+    frame = tc.frame.create(np.array([[1, 2], [3, 4], [5, 6]], dtype=np.int32), ["a"])
+    assert(frame.count() == 3)
+    assert(frame.schema == [("a", int), ("C1", int)])
+    assert(frame.take(3) == [[1, 2], [3, 4], [5, 6]])
+
+    frame = tc.frame.create(np.array([[1, 2], [3, 4]], dtype=np.int64))
+    assert(frame.schema == [("C0", long), ("C1", long)])
+    assert(frame.take(2) == [[1, 2], [3, 4]])
+
+    frame = tc.frame.create(np.array([[1.5], [2.5]]), [("value", float)])
+    assert(frame.schema == [("value", float)])
+    assert(frame.take(2) == [[1.5], [2.5]])
+
+    # uint64 values can overflow a long, so the schema is inferred from the values instead of the dtype
+    frame = tc.frame.create(np.array([[1, 2], [3, 4]], dtype=np.uint64))
+    assert(all(data_type in [int, long] for name, data_type in frame.schema))
+    assert(frame.take(2) == [[1, 2], [3, 4]])
+
+    try:
+        tc.frame.create(np.array([1, 2, 3]))
+        raise RuntimeError("Expected TypeError when creating a frame from a 1-dimensional numpy array.")
+    except TypeError as e:
+        assert("Invalid data source" in e.message)
+
 def test_create_frame_with_vectors(tc):
     """
     Tests  creating a frame with vectors, as well as failing use case where the vectors aren't all the same length.
@@ -114,6 +144,12 @@ def test_create_frame_with_vectors(tc):
         raise RuntimeError("Expected exception when creating frame with different vector lengths.")
     except:
         pass
+    try:
+        # A unicode value later in the column should not hide the vector length mismatch
+        tc.frame.create([[[1,2,3]],[[4,5,6,7]],[u"a"]])
+        raise RuntimeError("Expected exception when creating frame with different vector lengths and unicode.")
+    except ValueError:
+        pass
 
 def test_create_with_schema_validation(tc):
     """
@@ -145,6 +181,14 @@ def test_create_with_schema_validation(tc):
     # The last 20 rows of "xyz" should be None since they can't be parsed to integers
     for item in values[100:len(values)]:
         assert(item == [None])
+    # Test that missing values stay in their columns, rather than shifting the rest of the row
+    data = [[1, None], [None, 2]]
+    schema = [("a", int), ("b", int)]
+    frame = tc.frame.create(data, schema, validate_schema=True)
+    assert(frame.take(2) == [[1, None], [None, 2]])
+    result = frame.validate_pyrdd_schema(tc.sc.parallelize(data), schema)
+    assert(result.bad_value_count == 0)
+    assert(result.validated_rdd.collect() == [[1, None], [None, 2]])
 
 def test_frame_schema_validation(tc):
     """
@@ -61,3 +61,17 @@ def test_multiclass_classification_metrics_002(tc):
 
     confusion_matrix = cm.confusion_matrix.values.tolist()
     assert(confusion_matrix, [[2,0,0],[0,1,0],[1,1,1]], "computed confusion_matrix for this models should be equal to [2,0,0],[0,1,0],[1,1,1]")
+
+
+# Tests that a negative beta is rejected before reaching the engine
+def test_multiclass_classification_metrics_negative_beta(tc):
+    rows = [[0, 0],[1, 1],[2, 1]]
+    schema = [('labels', int),('predictions', int)]
+    frame = tc.frame.create(rows, schema)
+
+    try:
+        frame.multiclass_classification_metrics('labels', 'predictions', -1)
+    except ValueError as e:
+        assert("beta" in str(e))
+    else:
+        raise RuntimeError("Expected ValueError for negative beta")
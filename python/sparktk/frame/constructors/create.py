@@ -18,6 +18,7 @@
 from sparktk import TkContext
 from pyspark.rdd import RDD
 from pyspark.sql import DataFrame
+import numpy as np
 
 def create(data, schema=None, validate_schema=False, tc=TkContext.implicit):
     """
@@ -31,7 +32,7 @@ def create(data, schema=None, validate_schema=False, tc=TkContext.implicit):
     Parameters
     ----------
 
-    :param data: (List of row data or RDD) Data source
+    :param data: (List of row data, 2-dimensional numpy array or RDD) Data source
     :param schema: (Optional(list[tuple(str, type)] or list[str])) Optionally specify a schema (list of tuples of
                    string column names and data type), column names (list of strings, and the column data types will
                    be inferred) or None (column data types will be inferred and column names will be numbered like C0,
@@ -124,14 +125,30 @@ def create(data, schema=None, validate_schema=False, tc=TkContext.implicit):
     integer.  If validate_schema was disabled, no attempt is made to parse the data to the data type specified by the
     schema, and further frame operations may fail due to the data type discrepancy.
 
+    A frame can also be created from a 2-dimensional numpy array.  When only column names (or no schema) are
+    provided, integer, float (up to 64-bit) and string dtypes map directly to a data type: int8, int16, int32, uint8
+    and uint16 become int, int64 and uint32 become long, float16, float32 and float64 become float, and byte and
+    unicode strings become str and unicode.  Note that an int64 array, numpy's default integer dtype on most
+    platforms, gives long columns, while a list of the same integers is inferred as int.  Other dtypes (including
+    uint64, bool and object) are inferred from the array's values, the same way as for a list.
+
+        >>> import numpy as np
+        >>> frame = tc.frame.create(np.array([[1.5, 2.0], [3.0, 4.5]]), schema=["x", "y"])
+
+        >>> frame.schema
+        [('x', <type 'float'>), ('y', <type 'float'>)]
+
+        >>> frame.take(2)
+        [[1.5, 2.0], [3.0, 4.5]]
+
     """
     TkContext.validate(tc)
     if data is None:
         data = []
-    if not isinstance(data, list)\
+    if not isinstance(data, (list, np.ndarray))\
             and not isinstance(data, (RDD, DataFrame))\
-            and not tc._jutils.is_jvm_instance_of(data, tc.sc._jvm.org.apache.spark.rdd.RDD)\
-            and not tc._jutils.is_jvm_instance_of(data, tc.sc._jvm.org.apache.spark.sql.DataFrame):
-        raise TypeError("Invalid data source. Expected the data parameter to be a 2-dimensional list (list of row data) or an RDD or DataFrame, but received: %s" % type(data))
+            and not tc._jutils.is_jvm_instance_of(data, "org.apache.spark.rdd.RDD")\
+            and not tc._jutils.is_jvm_instance_of(data, "org.apache.spark.sql.DataFrame"):
+        raise TypeError("Invalid data source. Expected the data parameter to be a 2-dimensional list (list of row data), a 2-dimensional numpy array, an RDD or DataFrame, but received: %s" % type(data))
     from sparktk.frame.frame import Frame
     return Frame(tc, data, schema, validate_schema)
@@ -17,6 +17,7 @@
 
 from pyspark.rdd import RDD
 from pyspark.sql import DataFrame
+import numpy as np
 
 from sparktk.frame.pyframe import PythonFrame
 from sparktk.frame.schema import schema_to_python, schema_to_scala, schema_is_coercible
@@ -43,12 +44,22 @@ __all__ = ["create",
            "import_pandas",
            "load"]
 
+# fully qualified names of the JVM classes used for type checks; py4j only sends the class name to the JVM for an
+# instance check, so passing the name avoids looking up the class through the py4j gateway first
+_jvm_frame_class_name = "org.trustedanalytics.sparktk.frame.Frame"
+_jvm_rdd_class_name = "org.apache.spark.rdd.RDD"
+_jvm_dataframe_class_name = "org.apache.spark.sql.DataFrame"
+
+# merge_types orders these types from narrowest to widest, so merging any mix of them gives the widest one
+_scalar_type_rank = {bool: 0, int: 1, long: 2, float: 3, str: 4, unicode: 5}
+
 
 class Frame(object):
     
     def __init__(self, tc, source, schema=None, validate_schema=False):
         """(Private constructor -- use tc.frame.create or other methods available from the TkContext)"""
         self._tc = tc
+        self._row_count_cache = None  # (backing rdd key, row count) cached by count()
         if self._is_scala_frame(source):
             self._frame = source
         elif self._is_scala_rdd(source):
@@ -61,9 +72,11 @@ class Frame(object):
         elif isinstance(source, PythonFrame):
             self._frame = source
         else:
+            if isinstance(source, np.ndarray):
+                source, schema = self._ndarray_to_rows(source, schema)
             if not isinstance(source, RDD):
                 if not isinstance(source, list) or (len(source) > 0 and any(not isinstance(row, (list, tuple)) for row in source)):
-                    raise TypeError("Invalid data source.  The data parameter must be a 2-dimensional list (list of row data) or an RDD.")
+                    raise TypeError("Invalid data source.  The data parameter must be a 2-dimensional list (list of row data), a 2-dimensional numpy array, or an RDD.")
 
                 inferred_schema = False
                 if isinstance(schema, list):
@@ -76,8 +89,12 @@ class Frame(object):
                                   isinstance(item[0], basestring) for item in schema):
                         raise TypeError("Invalid schema.  Expected a list of tuples (str, type) with the column name and data type, but received type %s." % type(schema))
                     # check for duplicate column names
-                    column_names = [col[0] for col in schema]
-                    duplicate_column_names = set([col for col in column_names if column_names.count(col) > 1])
+                    column_names = set()
+                    duplicate_column_names = set()
+                    for col in schema:
+                        if col[0] in column_names:
+                            duplicate_column_names.add(col[0])
+                        column_names.add(col[0])
                     if len(duplicate_column_names) > 0:
                         raise ValueError("Invalid schema, column names cannot be duplicated: %s" % ", ".join(duplicate_column_names))
                 elif schema is None:
@@ -98,8 +115,14 @@ class Frame(object):
                             raise TypeError("Invalid schema.  %s is not a supported data type.\n\nSupported data types: %s" %
                                             (str(item[1]), dtypes.dtypes))
 
+                if schema and validate_schema:
+                    # The data is already local, so validate it before it's parallelized rather than in a spark job
+                    bad_value_counts = []
+                    source = list(self._validate_rows(source, self._build_casters(schema), bad_value_counts.append))
+                    logger.debug("%s values were unable to be parsed to the schema's data type." % sum(bad_value_counts))
+
                 source = tc.sc.parallelize(source)
-            if schema and validate_schema:
+            elif schema and validate_schema:
                 # Validate schema by going through the data and checking the data type and attempting to parse it
                 validate_schema_result = self.validate_pyrdd_schema(source, schema)
                 source = validate_schema_result.validated_rdd
@@ -109,37 +132,71 @@ class Frame(object):
             map_source = schema_is_coercible(source, list(schema))
             self._frame = PythonFrame(map_source, schema)
 
-    def _merge_types(self, type_list_a, type_list_b):
+    @staticmethod
+    def _ndarray_to_rows(ndarray, schema):
         """
-        Merges two lists of data types
+        Converts a 2-dimensional numpy array to a list of rows.  When only column names (or no schema) are provided
+        and the array's dtype has a direct equivalent (see _numpy_dtype_to_type), the schema is built from the dtype.
+        Otherwise the schema is left to be inferred from the values, the same way as for a list.
 
-        :param type_list_a: First list of data types to merge
-        :param type_list_b: Second list of data types to merge
-        :return: List of merged data types
+        :param ndarray: 2-dimensional numpy array
+        :param schema: Schema, list of column names, or None
+        :return: Tuple of the list of rows and the schema
         """
-        if not isinstance(type_list_a, list) or not isinstance(type_list_b, list):
-            raise TypeError("Unable to generate schema, because schema is not a list.")
-        if len(type_list_a) != len(type_list_b):
-            raise ValueError("Length of each row must be the same (found rows with lengths: %s and %s)." % (len(type_list_a), len(type_list_b)))
-        return [dtypes._DataTypes.merge_types(type_list_a[i], type_list_b[i]) for i in xrange(0, len(type_list_a))]
-
-    def _infer_types_for_row(self, row):
+        if ndarray.ndim != 2:
+            raise TypeError("Invalid data source.  A numpy array data source must be 2-dimensional, but received an array with %s dimension(s)." % ndarray.ndim)
+        data_type = _numpy_dtype_to_type(ndarray.dtype)
+        if data_type is not None and (schema is None or (isinstance(schema, list) and all(isinstance(item, basestring) for item in schema))):
+            column_names = schema if schema is not None else []
+            schema = [(column_names[i] if i < len(column_names) else "C%s" % i, data_type) for i in xrange(ndarray.shape[1])]
+        # tolist() converts the whole array to python values in C, rather than boxing each numpy scalar separately
+        return ndarray.tolist(), schema
+
+    def _infer_types_for_values(self, values):
         """
-        Returns a list of data types for the data in the specified row
+        Returns a list of data types for the specified values, which can be a row or a column of data
 
-        :param row: List or Row of data
+        :param values: List, tuple, or Row of data
         :return: List of data types
         """
-        inferred_types = []
-        for item in row:
-            if item is None:
-                inferred_types.append(int)
-            elif not isinstance(item, list):
-                inferred_types.append(type(item))
-            else:
-                inferred_types.append(dtypes.vector((len(item))))
+        inferred_types = map(type, values)
+        distinct_types = set(inferred_types)
+        if type(None) in distinct_types or any(issubclass(data_type, list) for data_type in distinct_types):
+            # missing values are treated as ints and lists as vectors
+            for index, item in enumerate(values):
+                if item is None:
+                    inferred_types[index] = int
+                elif isinstance(item, list):
+                    inferred_types[index] = dtypes.vector((len(item)))
         return inferred_types
 
+    def _infer_type_for_column(self, column):
+        """
+        Returns the merged data type for the data in the specified column
+
+        :param column: Tuple of the data in a column
+        :return: Merged data type
+        """
+        column_types = self._infer_types_for_values(column)
+        merged_type = column_types[0]
+        distinct_types = set(column_types)
+        if len(distinct_types) == 1:
+            # the column is uniform, so there is nothing to merge
+            return merged_type
+        if unicode in distinct_types and not any(isinstance(data_type, dtypes.vector) for data_type in distinct_types):
+            # unicode absorbs every other type, so there is no need to merge the column.  Columns with vectors
+            # still go through the merge, which raises for vectors of different lengths that precede the unicode.
+            return unicode
+        if all(data_type in _scalar_type_rank for data_type in distinct_types):
+            return max(distinct_types, key=_scalar_type_rank.get)
+        for data_type in column_types:
+            if data_type != merged_type:
+                merged_type = dtypes._DataTypes.merge_types(merged_type, data_type)
+                if merged_type == unicode:
+                    # unicode absorbs every other type, so the remaining values can't change the result
+                    break
+        return merged_type
+
     def _infer_schema(self, data, column_names=[], sample_size=100):
         """
         Infers the schema based on the data in the RDD.
@@ -156,15 +213,15 @@ class Frame(object):
 
         if isinstance(data, list):
             if len(data) > 0:
-                # get the schema for the first row
-                data_types = self._infer_types_for_row(data[0])
+                sample = data[:sample_size]
 
-                sample_size = min(sample_size, len(data))
+                # rows must all be the same length before the sample can be transposed into columns
+                row_lengths = set(map(len, sample))
+                if len(row_lengths) > 1:
+                    raise ValueError("Length of each row must be the same (found rows with lengths: %s)." % ", ".join(str(length) for length in sorted(row_lengths)))
 
-                for i in xrange (1, sample_size):
-                    data_types = self._merge_types(data_types, self._infer_types_for_row(data[i]))
-
-                for i, data_type in enumerate(data_types):
+                for i, column in enumerate(zip(*sample)):
+                    data_type = self._infer_type_for_column(column)
                     column_name = "C%s" % i
                     if len(column_names) > i:
                         column_name = column_names[i]
@@ -189,26 +246,68 @@ class Frame(object):
         else:
             return False
 
-    def validate_pyrdd_schema(self, pyrdd, schema):
-        if isinstance(pyrdd, RDD):
-            schema_length = len(schema)
-            num_bad_values = self._tc.sc.accumulator(0)
+    @staticmethod
+    def _build_casters(schema):
+        """
+        Returns a list with a function for each column in the schema that casts a value to the column's data type.
+
+        :param schema: List of tuples (str, type) with the column name and data type
+        :return: List of cast functions
+        """
+        casters = []
+        for name, data_type in schema:
+            if data_type in [int, float, long, str, unicode]:
+                # the builtin type is its own constructor
+                casters.append(data_type)
+            else:
+                casters.append(dtypes.dtypes.get_constructor(data_type))
+        return casters
 
-            def validate_schema(row, accumulator):
+    @staticmethod
+    def _validate_rows(rows, casters, bad_value_count_callback):
+        """
+        Generator that casts the values in each row to the data types of the schema's columns.  Values that cannot
+        be casted are replaced with None.
+
+        :param rows: Iterable of rows of data
+        :param casters: List of cast functions for the schema's columns (see _build_casters)
+        :param bad_value_count_callback: Function that is called with the number of values that were unable to be
+                                         casted, after all of the rows have been consumed
+        :return: Generator of validated rows
+        """
+        # bind builtins to locals, since they're used for every row
+        _len = len
+        _zip = zip
+        schema_length = _len(casters)
+        bad_value_count = 0
+        for row in rows:
+            if _len(row) != schema_length:
+                raise ValueError("Length of the row (%s) does not match the schema length (%s)." % (_len(row), schema_length))
+            try:
+                data = [None if value is None else caster(value) for caster, value in _zip(casters, row)]
+            except:
+                # cast the values one at a time, so that only the values that can't be casted are replaced with None
                 data = []
-                if len(row) != schema_length:
-                    raise ValueError("Length of the row (%s) does not match the schema length (%s)." % (len(row), len(schema)))
-                for index, column in enumerate(schema):
-                    data_type = column[1]
-                    try:
-                        if row[index] is not None:
-                            data.append(dtypes.dtypes.cast(row[index], data_type))
-                    except:
+                for caster, value in _zip(casters, row):
+                    if value is None:
                         data.append(None)
-                        accumulator += 1
-                return data
+                    else:
+                        try:
+                            data.append(caster(value))
+                        except:
+                            data.append(None)
+                            bad_value_count += 1
+            yield data
+        bad_value_count_callback(bad_value_count)
 
-            validated_rdd = pyrdd.map(lambda row: validate_schema(row, num_bad_values))
+    def validate_pyrdd_schema(self, pyrdd, schema):
+        if isinstance(pyrdd, RDD):
+            casters = self._build_casters(schema)
+            num_bad_values = self._tc.sc.accumulator(0)
+            validate_rows = self._validate_rows
+
+            # the accumulator is updated once per partition, rather than once per bad value
+            validated_rdd = pyrdd.mapPartitions(lambda rows: validate_rows(rows, casters, num_bad_values.add))
 
             # Force rdd to load, so that we can get a bad value count
             validated_rdd.count()
@@ -239,13 +338,13 @@ class Frame(object):
         return self._create_scala_frame(self._tc.sc, scala_rdd, scala_schema)
 
     def _is_scala_frame(self, item):
-        return self._tc._jutils.is_jvm_instance_of(item, self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.Frame)
+        return self._tc._jutils.is_jvm_instance_of(item, _jvm_frame_class_name)
 
     def _is_scala_rdd(self, item):
-        return self._tc._jutils.is_jvm_instance_of(item, self._tc.sc._jvm.org.apache.spark.rdd.RDD)
+        return self._tc._jutils.is_jvm_instance_of(item, _jvm_rdd_class_name)
 
     def _is_scala_dataframe(self, item):
-        return self._tc._jutils.is_jvm_instance_of(item, self._tc.sc._jvm.org.apache.spark.sql.DataFrame)
+        return self._tc._jutils.is_jvm_instance_of(item, _jvm_dataframe_class_name)
 
     def _is_python_rdd(self, item):
         return isinstance(item, RDD)
@@ -403,6 +502,27 @@ class Frame(object):
     from sparktk.frame.ops.unflatten_columns import unflatten_columns
 
 
+def _numpy_dtype_to_type(dtype):
+    """
+    Returns the sparktk data type for the specified numpy dtype, or None if there is no direct equivalent
+    """
+    if dtype.kind == 'i':
+        return long if dtype.itemsize > 4 else int
+    elif dtype.kind == 'u':
+        # uint64 values can overflow the engine's 64-bit signed long
+        if dtype.itemsize < 8:
+            return long if dtype.itemsize >= 4 else int
+    elif dtype.kind == 'f':
+        # tolist() keeps wider floats (i.e. longdouble) as numpy scalars, rather than python floats
+        if dtype.itemsize <= 8:
+            return float
+    elif dtype.kind == 'S':
+        return str
+    elif dtype.kind == 'U':
+        return unicode
+    return None
+
+
 def load(path, tc=TkContext.implicit):
     """load Frame from given path"""
     TkContext.validate(tc)
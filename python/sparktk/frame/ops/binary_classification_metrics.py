@@ -129,6 +129,8 @@ def binary_classification_metrics(self, label_column, pred_column, pos_label, be
         Actual_Neg              0              2
 
     """
+    if beta < 0:
+        raise ValueError("Bad value %s.  beta must be a number >= 0" % beta)
     return ClassificationMetricsValue(self._tc, self._scala.binaryClassificationMetrics(label_column,
                                       pred_column,
                                       pos_label,
@@ -15,7 +15,8 @@
 #  limitations under the License.
 #
 
-import pandas as pd
+import json
+import numpy as np
 from sparktk.propobj import PropertiesObject
 
 class ClassificationMetricsValue(PropertiesObject):
@@ -25,23 +26,27 @@ class ClassificationMetricsValue(PropertiesObject):
     """
     def __init__(self, tc,  scala_result):
         self._tc = tc
-        self._accuracy = scala_result.accuracy()
-        cm = scala_result.confusionMatrix()
+        # fetch everything in one gateway call rather than one call per metric, label list and matrix row
+        result = json.loads(scala_result.toJson())
+        self._accuracy = result["accuracy"]
+        # the pandas confusion matrix is only built when first asked for
+        self._confusion_matrix_source = result.get("confusionMatrix")
+        self._confusion_matrix = None
+        self._f_measure = result["fMeasure"]
+        self._precision = result["precision"]
+        self._recall = result["recall"]
+
+    def _build_confusion_matrix(self):
+        import pandas as pd
+        cm = self._confusion_matrix_source
         if cm:
-            self._confusion_matrix = cm
-            column_list = self._tc.jutils.convert.from_scala_seq(cm.columnLabels())
-            row_label_list = self._tc.jutils.convert.from_scala_seq(cm.rowLabels())
-            header = ["Predicted_" + column.title() for column in column_list]
-            row_index = ["Actual_" + row_label.title() for row_label in row_label_list]
-            data = [list(x) for x in list(cm.getMatrix())]
-            self._confusion_matrix = pd.DataFrame(data, index=row_index, columns=header)
+            header = ["Predicted_" + column.title() for column in cm["columnLabels"]]
+            row_index = ["Actual_" + row_label.title() for row_label in cm["rowLabels"]]
+            data = np.asarray(cm["matrix"], dtype=np.int64).reshape(cm["numRows"], cm["numColumns"])
+            return pd.DataFrame(data, index=pd.Index(row_index), columns=pd.Index(header), copy=False)
         else:
             #empty pandas frame
-            self._confusion_matrix = pd.DataFrame()
-
-        self._f_measure = scala_result.fMeasure()
-        self._precision = scala_result.precision()
-        self._recall = scala_result.recall()
+            return pd.DataFrame()
 
     @property
     def accuracy(self):
@@ -49,6 +54,9 @@ class ClassificationMetricsValue(PropertiesObject):
 
     @property
     def confusion_matrix(self):
+        if self._confusion_matrix is None:
+            self._confusion_matrix = self._build_confusion_matrix()
+            self._confusion_matrix_source = None
         return self._confusion_matrix
 
     @property
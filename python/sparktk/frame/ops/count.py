@@ -62,6 +62,10 @@ def count(self, where=None):
 
         return self._python.rdd.filter(lambda r: count_where(r)).count()
     else:
-        if self._is_scala:
-            return int(self._scala.rowCount())
-        return self.rdd.count()
+        # the cached count is keyed by the backing rdd, which is replaced whenever rows are added or removed
+        is_scala = self._is_scala
+        rdd_key = self._frame.rdd().id() if is_scala else self._frame.rdd
+        if self._row_count_cache is None or self._row_count_cache[0] != rdd_key:
+            row_count = int(self._frame.rowCount()) if is_scala else self._frame.rdd.count()
+            self._row_count_cache = (rdd_key, row_count)
+        return self._row_count_cache[1]
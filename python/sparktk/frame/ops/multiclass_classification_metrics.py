@@ -127,6 +127,8 @@ def multiclass_classification_metrics(self, label_column, pred_column, beta=1.0,
         Actual_5            0            0            1
 
     """
+    if beta < 0:
+        raise ValueError("Bad value %s.  beta must be a number >= 0" % beta)
     return ClassificationMetricsValue(self._tc, self._scala.multiClassClassificationMetrics(label_column,
                                       pred_column,
                                       float(beta),
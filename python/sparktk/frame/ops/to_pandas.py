@@ -15,6 +15,8 @@
 #  limitations under the License.
 #
 
+from sparktk import dtypes
+
 
 def to_pandas(self, n=None, offset=0, columns=None):
     """
@@ -76,7 +78,6 @@ def to_pandas(self, n=None, offset=0, columns=None):
     headers, data_types = zip(*result.schema)
     frame_data = result.data
 
-    from sparktk import dtypes
     import datetime
 
     date_time_columns = [i for i, x in enumerate(self.schema) if x[1] in (dtypes.datetime, datetime.datetime)]
@@ -111,7 +112,6 @@ def to_pandas(self, n=None, offset=0, columns=None):
 
 def _sparktk_dtype_to_pandas_str(dtype):
     """maps spark-tk schema types to types understood by pandas, returns string"""
-    from sparktk import dtypes
     if dtype ==dtypes.datetime:
         return "datetime64[ns]"
     elif dtypes.dtypes.is_primitive_type(dtype):
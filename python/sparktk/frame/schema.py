@@ -42,9 +42,21 @@ def get_indices_for_selected_columns(schema, selected_columns):
     return indices
 
 
+# Scala schemas are immutable, so conversions are cached by spark context and schema to skip the py4j round trips
+_scala_schema_cache = {}
+_scala_schema_cache_max_size = 128
+
+
 def schema_to_scala(sc, python_schema):
     list_of_list_of_str_schema = map(lambda t: [t[0], dtypes.to_string(t[1])], python_schema)  # convert dtypes to strings
-    return jvm_scala_schema(sc).pythonToScala(list_of_list_of_str_schema)
+    key = (sc, tuple(tuple(column) for column in list_of_list_of_str_schema))
+    scala_schema = _scala_schema_cache.get(key)
+    if scala_schema is None:
+        if len(_scala_schema_cache) >= _scala_schema_cache_max_size:
+            _scala_schema_cache.clear()
+        scala_schema = jvm_scala_schema(sc).pythonToScala(list_of_list_of_str_schema)
+        _scala_schema_cache[key] = scala_schema
+    return scala_schema
 
 
 def schema_to_python(sc, scala_schema):
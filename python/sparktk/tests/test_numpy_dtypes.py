@@ -0,0 +1,54 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import unittest
+import numpy as np
+
+from sparktk.frame.frame import _numpy_dtype_to_type
+
+
+class TestNumpyDtypes(unittest.TestCase):
+
+    def test_integer_dtypes(self):
+        for dtype in [np.int8, np.int16, np.int32, np.uint8, np.uint16]:
+            self.assertEqual(_numpy_dtype_to_type(np.dtype(dtype)), int)
+        for dtype in [np.int64, np.uint32]:
+            self.assertEqual(_numpy_dtype_to_type(np.dtype(dtype)), long)
+
+    def test_uint64_is_not_mapped(self):
+        # uint64 values can overflow a long, so the schema is inferred from the values instead
+        self.assertIsNone(_numpy_dtype_to_type(np.dtype(np.uint64)))
+
+    def test_float_dtypes(self):
+        for dtype in [np.float16, np.float32, np.float64]:
+            self.assertEqual(_numpy_dtype_to_type(np.dtype(dtype)), float)
+
+    def test_wide_float_is_not_mapped(self):
+        # tolist() keeps floats wider than 64 bits as numpy scalars, so they don't map to float
+        longdouble = np.dtype(np.longdouble)
+        self.assertEqual(_numpy_dtype_to_type(longdouble), float if longdouble.itemsize <= 8 else None)
+
+    def test_string_dtypes(self):
+        self.assertEqual(_numpy_dtype_to_type(np.dtype("S3")), str)
+        self.assertEqual(_numpy_dtype_to_type(np.dtype("U3")), unicode)
+
+    def test_other_dtypes_are_not_mapped(self):
+        for dtype in [np.bool_, np.object_, np.complex128, "datetime64[D]"]:
+            self.assertIsNone(_numpy_dtype_to_type(np.dtype(dtype)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,11 +17,40 @@
 
 import unittest
 
-from sparktk.frame.schema import get_indices_for_selected_columns
+from sparktk.frame import schema as schema_module
+from sparktk.frame.schema import get_indices_for_selected_columns, schema_to_scala
+from sparktk.dtypes import vector
+
+
+class FakeSchemaHelper(object):
+    """Stands in for the JVM SchemaHelper, recording the schemas passed to pythonToScala"""
+
+    def __init__(self):
+        self.calls = []
+
+    def pythonToScala(self, schema):
+        self.calls.append(schema)
+        return object()
+
+
+class FakeSparkContext(object):
+    """Just enough of a SparkContext for sc._jvm.org.trustedanalytics.sparktk.frame.SchemaHelper"""
+
+    def __init__(self):
+        self.schema_helper = FakeSchemaHelper()
+        self._jvm = self._namespace(org=self._namespace(trustedanalytics=self._namespace(sparktk=self._namespace(
+            frame=self._namespace(SchemaHelper=self.schema_helper)))))
+
+    @staticmethod
+    def _namespace(**attributes):
+        return type("Namespace", (object,), attributes)
 
 
 class TestSchema(unittest.TestCase):
 
+    def setUp(self):
+        schema_module._scala_schema_cache.clear()
+
     def test_get_indices_for_selected_columns(self):
         results = get_indices_for_selected_columns([("a", int),
                                                     ("b", int),
@@ -31,6 +60,41 @@ class TestSchema(unittest.TestCase):
                                                     ("f", int)], ['b', 'e', 'f'])
         print results
 
+    def test_schema_to_scala_caches_repeated_schema(self):
+        sc = FakeSparkContext()
+        first = schema_to_scala(sc, [("a", int), ("b", str)])
+        second = schema_to_scala(sc, [("a", int), ("b", str)])
+        self.assertIs(first, second)
+        self.assertEqual(len(sc.schema_helper.calls), 1)
+
+    def test_schema_to_scala_separates_vector_lengths(self):
+        sc = FakeSparkContext()
+        vector2 = schema_to_scala(sc, [("v", vector(2))])
+        vector3 = schema_to_scala(sc, [("v", vector(3))])
+        self.assertIsNot(vector2, vector3)
+        self.assertEqual(len(sc.schema_helper.calls), 2)
+        self.assertIs(schema_to_scala(sc, [("v", vector(2))]), vector2)
+        self.assertEqual(len(sc.schema_helper.calls), 2)
+
+    def test_schema_to_scala_separates_contexts(self):
+        sc1 = FakeSparkContext()
+        sc2 = FakeSparkContext()
+        schema_to_scala(sc1, [("a", int)])
+        schema_to_scala(sc2, [("a", int)])
+        self.assertEqual(len(sc1.schema_helper.calls), 1)
+        self.assertEqual(len(sc2.schema_helper.calls), 1)
+
+    def test_schema_to_scala_clears_when_full(self):
+        sc = FakeSparkContext()
+        max_size = schema_module._scala_schema_cache_max_size
+        for i in xrange(max_size):
+            schema_to_scala(sc, [("c%s" % i, int)])
+        self.assertEqual(len(schema_module._scala_schema_cache), max_size)
+        schema_to_scala(sc, [("another", int)])
+        self.assertEqual(len(schema_module._scala_schema_cache), 1)
+        schema_to_scala(sc, [("c0", int)])
+        self.assertEqual(len(sc.schema_helper.calls), max_size + 2)
+
 
 
 if __name__ == '__main__':
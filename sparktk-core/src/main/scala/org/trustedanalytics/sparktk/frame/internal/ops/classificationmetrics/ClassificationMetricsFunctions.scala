@@ -18,6 +18,8 @@ package org.trustedanalytics.sparktk.frame.internal.ops.classificationmetrics
 import org.trustedanalytics.sparktk.frame.internal.rdd.{ FrameRdd, ScoreAndLabel }
 import scala.reflect.ClassTag
 import org.apache.spark.rdd.RDD
+import org.json4s.JsonDSL._
+import org.json4s.jackson.JsonMethods._
 
 /**
  * Classification metrics
@@ -32,7 +34,31 @@ case class ClassificationMetricValue(fMeasure: Double,
                                      accuracy: Double,
                                      recall: Double,
                                      precision: Double,
-                                     confusionMatrix: ConfusionMatrix)
+                                     confusionMatrix: ConfusionMatrix) {
+
+  /**
+   * Serialize the metrics and confusion matrix into a single JSON string
+   *
+   * Lets a gateway client (i.e. python) fetch the whole result in one call, rather than one call per metric,
+   * label list and matrix row.  The matrix is flattened row-major (rows are actual, columns are predicted).
+   *
+   * @return JSON string with fMeasure, accuracy, recall, precision and (if present) confusionMatrix
+   */
+  def toJson: String = {
+    val matrixJson = Option(confusionMatrix).map(cm =>
+      ("rowLabels" -> cm.rowLabels.toList) ~
+        ("columnLabels" -> cm.columnLabels.toList) ~
+        ("numRows" -> cm.numRows) ~
+        ("numColumns" -> cm.numColumns) ~
+        ("matrix" -> cm.flatMatrix.toList))
+    compact(render(
+      ("fMeasure" -> fMeasure) ~
+        ("accuracy" -> accuracy) ~
+        ("recall" -> recall) ~
+        ("precision" -> precision) ~
+        ("confusionMatrix" -> matrixJson)))
+  }
+}
 
 /**
  * Model Accuracy, Precision, Recall, FMeasure, ConfusionMatrix
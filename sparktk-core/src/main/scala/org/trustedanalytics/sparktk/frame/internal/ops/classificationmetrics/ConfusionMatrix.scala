@@ -30,6 +30,11 @@ case class ConfusionMatrix(rowLabels: Seq[String], columnLabels: Seq[String]) {
 
   def getMatrix: Array[Array[Long]] = matrix
 
+  /**
+   * matrix values flattened in row-major order (rows are actual, columns are predicted)
+   */
+  def flatMatrix: Array[Long] = matrix.flatten
+
   def setMatrix(matrix: Array[Array[Long]]): Unit = {
     this.matrix = matrix
   }
@@ -239,4 +239,28 @@ class BinaryClassMetricTest extends TestingSparkContextWordSpec with Matchers {
       fmeasure shouldEqual 0.0
     }
   }
+
+  "json serialization" should {
+    "serialize binary classifier metrics with a flat row-major matrix" in {
+      val rdd = sparkContext.parallelize(inputListBinary)
+      val binaryClassMetrics = new BinaryClassMetrics(rdd, 1)
+      val metricValue = ClassificationMetricValue(binaryClassMetrics.fmeasure(),
+        binaryClassMetrics.accuracy(),
+        binaryClassMetrics.recall(),
+        binaryClassMetrics.precision(),
+        binaryClassMetrics.confusionMatrix())
+
+      val json = metricValue.toJson
+      json should include("\"accuracy\":0.75")
+      json should include("\"rowLabels\":[\"pos\",\"neg\"]")
+      json should include("\"numRows\":2")
+      json should include("\"matrix\":[1,1,0,2]")
+    }
+
+    "serialize to json without a confusion matrix" in {
+      val json = ClassificationMetricValue(1.0, 1.0, 1.0, 1.0, null).toJson
+      json should include("\"fMeasure\":1.0")
+      json should not include "confusionMatrix"
+    }
+  }
 }
@@ -66,6 +66,7 @@ class ConfusionMatrixTest extends TestingSparkContextWordSpec with Matchers {
       confusionMatrix.get("pos", "neg") should equal(0)
       confusionMatrix.get("neg", "pos") should equal(1)
       confusionMatrix.get("neg", "neg") should equal(2)
+      confusionMatrix.flatMatrix should equal(Array(1L, 1L, 0L, 2L))
     }
 
     "compute predicted vs. actual class for binary classifier with string labels" in {
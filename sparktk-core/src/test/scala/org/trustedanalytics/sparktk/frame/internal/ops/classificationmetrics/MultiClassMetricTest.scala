@@ -168,4 +168,30 @@ class MultiClassMetricTest extends TestingSparkContextWordSpec with Matchers {
       diff should be <= 0.0000001
     }
   }
+
+  "json serialization" should {
+    "serialize multi-class classifier metrics with a flat row-major matrix" in {
+      // predictions include a label (3) that never appears as an actual label, so the row and column labels differ
+      val rdd = sparkContext.parallelize(List(
+        ScoreAndLabel(0, 0),
+        ScoreAndLabel(3, 1),
+        ScoreAndLabel(1, 2),
+        ScoreAndLabel(0, 0),
+        ScoreAndLabel(0, 1),
+        ScoreAndLabel(1, 2)))
+      val multiClassMetrics = new MultiClassMetrics(rdd, 1)
+      val metricValue = ClassificationMetricValue(multiClassMetrics.weightedFmeasure(),
+        multiClassMetrics.accuracy(),
+        multiClassMetrics.weightedRecall(),
+        multiClassMetrics.weightedPrecision(),
+        multiClassMetrics.confusionMatrix())
+
+      val json = metricValue.toJson
+      json should include("\"rowLabels\":[\"0\",\"1\",\"2\"]")
+      json should include("\"columnLabels\":[\"0\",\"1\",\"3\"]")
+      json should include("\"numRows\":3")
+      json should include("\"numColumns\":3")
+      json should include("\"matrix\":[2,0,0,1,0,1,0,2,0]")
+    }
+  }
 }